@@ -1,7 +1,14 @@
+import atexit
+import functools
+import itertools
+import re
 import sqlite3
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta, date
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, date
 
 DB_FILE = "internships.db"
 
@@ -15,70 +22,407 @@ STATUSES = [
     "Archived",
 ]
 
+# Row colours in the main table, applied via Treeview tags named after the status.
+STATUS_TAG_COLORS = {
+    "Follow-up Needed": "#b36b00",
+    "Interviewing": "#1f5fa8",
+    "Offer": "#2e7d32",
+    "Rejected": "#a33",
+    "Archived": "gray",
+}
+
+# Treeview columns as (key, heading, width, anchor).
+_COLS = (
+    ("id", "ID", 50, "center"),
+    ("company", "Company", 200, "w"),
+    ("role", "Role", 280, "w"),
+    ("date_applied", "Date Applied", 110, "center"),
+    ("status", "Status", 160, "w"),
+    ("follow_up", "Follow-up Date", 120, "center"),
+    ("archived", "Archived", 90, "center"),
+)
+
+_DUE_COLS = (
+    ("id", "ID", 50, "center"),
+    ("company", "Company", 180, "w"),
+    ("role", "Role", 230, "w"),
+    ("follow_up", "Follow-up Date", 120, "center"),
+    ("due_label", "Due", 120, "center"),
+    ("status", "Status", 140, "w"),
+)
+
+# The main table is virtual: rows are fetched from SQLite one page at a time as they scroll into view.
+PAGE_SIZE = 100
+PAGE_CACHE_SIZE = 8
+# Search runs this long after the last keystroke in the Search box.
+SEARCH_DEBOUNCE_MS = 250
+# Rows inserted between repaints when streaming a full result set into a Treeview.
+FETCH_BATCH_SIZE = 500
+# Rows per executemany() call in bulk_insert.
+INSERT_CHUNK_SIZE = 500
+# Default follow-up delay after the application date.
+FOLLOW_UP_DAYS = 10
+
+# date_applied/follow_up_date are stored as INTEGER days since 1970-01-01 (4-byte ints instead of 10-char strings,
+# compared and indexed as numbers); _DAY_SQL renders one back as YYYY-MM-DD inside a query.
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DAY_SQL = "date({} * 86400, 'unixepoch')"
+
+# Fixed statement texts so the connection's statement cache can reuse the compiled statements.
+_INSERT_APPLICATION = """
+    INSERT INTO Applications
+    (company_name, role_title, date_applied, status, follow_up_date, notes, archived)
+    VALUES (?, ?, ?, ?, ?, ?, 0)
+"""
+SQL_INSERT = _INSERT_APPLICATION + ";"
+# Save reads the id back from the write itself instead of a second last_insert_rowid()/existence SELECT.
+SQL_INSERT_RETURNING = _INSERT_APPLICATION + "RETURNING application_id;"
+
+SQL_UPDATE = """
+    UPDATE Applications
+    SET company_name = ?, role_title = ?, date_applied = ?, status = ?, follow_up_date = ?, notes = ?
+    WHERE application_id = ?
+    RETURNING application_id;
+"""
+
+SQL_SELECT_ONE = f"""
+    SELECT application_id, company_name, role_title, {_DAY_SQL.format("date_applied")} AS date_applied, status,
+        COALESCE(notes, '') AS notes, archived
+    FROM Applications
+    WHERE application_id = ?;
+"""
+
+# Main-table statements come in two fixed texts, keyed by the Show Archived setting (False/True): a literal
+# "archived = 0" lets SQLite search idx_apps_archived_id/idx_apps_archived_status, which a bound
+# (:show_archived OR archived = 0) would not. Other inactive filters are bound as NULL instead of being
+# left out, so every refresh reuses one of the two cached statements.
+_ARCHIVED_WHERE = {False: "WHERE archived = 0", True: "WHERE 1"}
+_FILTER_AND = """
+    AND (:status IS NULL OR status = :status)
+    AND (:q IS NULL OR application_id IN (SELECT rowid FROM Applications_fts WHERE Applications_fts MATCH :q))
+"""
+
+SQL_SELECT_ALL = {
+    show_archived: f"""
+    SELECT application_id, company_name, role_title, {_DAY_SQL.format("date_applied")}, status,
+        {_DAY_SQL.format("follow_up_date")}, CASE archived WHEN 1 THEN 'Yes' ELSE 'No' END
+    FROM Applications
+    {where}
+    {_FILTER_AND}
+    ORDER BY application_id DESC
+    LIMIT :limit OFFSET :offset;
+"""
+    for show_archived, where in _ARCHIVED_WHERE.items()
+}
+
+# Keyset variant of SQL_SELECT_ALL for the page right after one already fetched: seeks straight to
+# the next id instead of stepping over OFFSET rows.
+SQL_SELECT_AFTER = {
+    show_archived: f"""
+    SELECT application_id, company_name, role_title, {_DAY_SQL.format("date_applied")}, status,
+        {_DAY_SQL.format("follow_up_date")}, CASE archived WHEN 1 THEN 'Yes' ELSE 'No' END
+    FROM Applications
+    {where}
+    {_FILTER_AND}
+    AND application_id < :after_id
+    ORDER BY application_id DESC
+    LIMIT :limit;
+"""
+    for show_archived, where in _ARCHIVED_WHERE.items()
+}
+
+SQL_COUNT_ALL = {
+    show_archived: f"""
+    SELECT COUNT(*)
+    FROM Applications
+    {where}
+    {_FILTER_AND};
+"""
+    for show_archived, where in _ARCHIVED_WHERE.items()
+}
+
+# Row counts for the unfiltered views: all rows, and active (not archived) rows.
+SQL_ROW_TOTALS = "SELECT COUNT(*), COALESCE(SUM(archived = 0), 0) FROM Applications;"
+
+SQL_STATUS_COUNTS = {
+    show_archived: f"""
+    SELECT status, COUNT(*)
+    FROM Applications
+    {where}
+    GROUP BY status
+    ORDER BY status;
+"""
+    for show_archived, where in _ARCHIVED_WHERE.items()
+}
+
+# Cheap pre-check for YYYY-MM-DD before the real parse.
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# _conn is used on the Tk thread; _worker_conn only by the main window's DB worker (refresh queries and
+# form saves). Each thread runs its transactions on its own connection, so a commit or rollback on one can
+# never end a transaction the other has open. WAL lets each read while the other writes.
+_conn: sqlite3.Connection | None = None
+_worker_conn: sqlite3.Connection | None = None
+
+
+def _open_conn() -> sqlite3.Connection:
+    # Rows come back as plain tuples; only fetch_application_by_id asks for sqlite3.Row.
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=256)
+    # WAL + NORMAL sync avoids an fsync per Save; mmap speeds up table reads.
+    conn.executescript(
+        """
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -64000;
+        PRAGMA mmap_size = 268435456;
+        """
+    )
+    return conn
+
+
+def get_conn() -> sqlite3.Connection:
+    """Return the shared SQLite connection, opening it on first use."""
+    global _conn
+    if _conn is None:
+        _conn = _open_conn()
+    return _conn
+
+
+def get_worker_conn() -> sqlite3.Connection:
+    """Return the DB worker's own connection, opening it on first use. Only call it from the worker."""
+    global _worker_conn
+    if _worker_conn is None:
+        _worker_conn = _open_conn()
+    return _worker_conn
+
+
+def close_conn() -> None:
+    """Close the shared and worker connections if they are open. A later get_conn() reopens them."""
+    global _conn, _worker_conn
+    for conn in (_conn, _worker_conn):
+        if conn is not None:
+            conn.close()
+    _conn = _worker_conn = None
+
+
+# Registered once here rather than per connection opened; close_conn is a no-op when nothing is open.
+atexit.register(close_conn)
+
+
+# application_id is an INTEGER PRIMARY KEY, i.e. an alias for the rowid: the table is already a single
+# B-tree keyed by id, so WITHOUT ROWID would gain nothing and would lose AUTOINCREMENT (ids never reused).
+_CREATE_APPLICATIONS = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        application_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        role_title TEXT NOT NULL,
+        date_applied INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        follow_up_date INTEGER NOT NULL,
+        application_link TEXT,
+        location TEXT,
+        notes TEXT,
+        archived INTEGER NOT NULL DEFAULT 0
+    );
+"""
+
+_APPLICATION_COLUMNS = (
+    "application_id, company_name, role_title, date_applied, status, follow_up_date, "
+    "application_link, location, notes, archived"
+)
+
+
+def _migrate_text_dates(conn: sqlite3.Connection) -> None:
+    """Rebuild an Applications table from before dates were stored as day numbers, keeping every id."""
+    column_types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(Applications);")}
+    if column_types.get("date_applied", "").upper() != "TEXT":
+        return
+
+    def to_days(value: str) -> int:
+        # Older versions validated with strptime, which also let through unpadded dates like 2026-2-1.
+        return to_epoch_day(datetime.strptime(value.strip(), "%Y-%m-%d").date())
+
+    conn.execute(_CREATE_APPLICATIONS.format(table="Applications_new"))
+    rows = conn.execute(f"SELECT {_APPLICATION_COLUMNS} FROM Applications;")
+    conn.executemany(
+        f"INSERT INTO Applications_new ({_APPLICATION_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
+        ((r[0], r[1], r[2], to_days(r[3]), r[4], to_days(r[5]), *r[6:]) for r in rows.fetchall()),
+    )
+    # The copy only advances the new table's sequence to the highest surviving id; carry the old one over
+    # so ids of rows deleted from the top are still never handed out again.
+    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'Applications';").fetchone()
+    # Dropping the old table also drops its indexes and FTS triggers; init_db recreates them.
+    conn.execute("DROP TABLE Applications;")
+    conn.execute("ALTER TABLE Applications_new RENAME TO Applications;")
+    if seq is not None:
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = 'Applications';")
+        conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('Applications', ?);", seq)
+
 
 def init_db() -> None:
     """Create the SQLite database and Applications table if they do not exist."""
-    with sqlite3.connect(DB_FILE) as conn:
+    conn = get_conn()
+    with conn:
+        conn.execute(_CREATE_APPLICATIONS.format(table="Applications"))
+        _migrate_text_dates(conn)
+        # No index on application_id alone: it is the rowid, so the table itself is already stored in display
+        # order and a backward scan of it needs no sort. Drop the copy-every-column index earlier versions made.
+        conn.execute("DROP INDEX IF EXISTS idx_apps_covering;")
+        # Filter/sort indexes: active rows newest-first, status counts, and the follow-ups due list.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_apps_archived_id ON Applications(archived, application_id DESC);"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_apps_archived_status ON Applications(archived, status);")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_apps_followup
+            ON Applications(archived, follow_up_date)
+            WHERE archived = 0;
+            """
+        )
+
+        # Full-text index for Search, kept in sync with Applications by triggers.
+        fts_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Applications_fts';"
+        ).fetchone()
         conn.execute(
             """
-            CREATE TABLE IF NOT EXISTS Applications (
-                application_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company_name TEXT NOT NULL,
-                role_title TEXT NOT NULL,
-                date_applied TEXT NOT NULL,
-                status TEXT NOT NULL,
-                follow_up_date TEXT NOT NULL,
-                application_link TEXT,
-                location TEXT,
-                notes TEXT,
-                archived INTEGER NOT NULL DEFAULT 0
+            CREATE VIRTUAL TABLE IF NOT EXISTS Applications_fts USING fts5(
+                company_name, role_title, notes,
+                content='Applications', content_rowid='application_id'
             );
             """
         )
-        conn.commit()
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS applications_fts_insert AFTER INSERT ON Applications BEGIN
+                INSERT INTO Applications_fts(rowid, company_name, role_title, notes)
+                VALUES (new.application_id, new.company_name, new.role_title, new.notes);
+            END;
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS applications_fts_delete AFTER DELETE ON Applications BEGIN
+                INSERT INTO Applications_fts(Applications_fts, rowid, company_name, role_title, notes)
+                VALUES ('delete', old.application_id, old.company_name, old.role_title, old.notes);
+            END;
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS applications_fts_update
+            AFTER UPDATE OF company_name, role_title, notes ON Applications BEGIN
+                INSERT INTO Applications_fts(Applications_fts, rowid, company_name, role_title, notes)
+                VALUES ('delete', old.application_id, old.company_name, old.role_title, old.notes);
+                INSERT INTO Applications_fts(rowid, company_name, role_title, notes)
+                VALUES (new.application_id, new.company_name, new.role_title, new.notes);
+            END;
+            """
+        )
+        if not fts_exists:
+            # Index rows saved before the FTS table existed.
+            conn.execute("INSERT INTO Applications_fts(Applications_fts) VALUES ('rebuild');")
 
 
-def parse_date_iso(date_str: str) -> datetime:
-    """Parse YYYY-MM-DD. Raise ValueError if invalid."""
-    return datetime.strptime(date_str.strip(), "%Y-%m-%d")
+def _check_iso_layout(date_str: str) -> str:
+    """fromisoformat also accepts forms like 20260211 or 2026-W06-1; only allow YYYY-MM-DD."""
+    if not _DATE_RE.fullmatch(date_str):
+        raise ValueError(f"Invalid date: {date_str!r}")
+    return date_str
 
 
 def parse_date_only(date_str: str) -> date:
     """Parse YYYY-MM-DD into a date object. Raise ValueError if invalid."""
-    return datetime.strptime(date_str.strip(), "%Y-%m-%d").date()
+    return date.fromisoformat(_check_iso_layout(date_str.strip()))
+
 
+def to_epoch_day(d: date) -> int:
+    """Return the day number stored in the date columns for d."""
+    return d.toordinal() - _EPOCH_ORDINAL
 
-def calculate_follow_up(date_applied_iso: str) -> str:
-    """Default follow-up is +10 days, returned as YYYY-MM-DD."""
-    dt = parse_date_iso(date_applied_iso)
-    return (dt + timedelta(days=10)).strftime("%Y-%m-%d")
 
+def fts_prefix_query(text: str) -> str:
+    """Turn search text into an FTS5 query: every word must appear, matched as a prefix."""
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
 
-def fetch_application_by_id(app_id: int) -> dict | None:
-    """Fetch one application record and return it as a dict, or None if not found."""
-    with sqlite3.connect(DB_FILE) as conn:
+
+def visible_page_range(count: int, first_row: int, rows: int) -> range:
+    """
+    Pages of a `count`-row list holding the `rows` rows from first_row on (clamped to the list),
+    never more than PAGE_CACHE_SIZE of them.
+    """
+    if not count:
+        return range(0)
+    start = min(first_row, count - 1)
+    stop = min(start + max(rows, 1), count)
+    first_page = start // PAGE_SIZE
+    return range(first_page, min((stop - 1) // PAGE_SIZE + 1, first_page + PAGE_CACHE_SIZE))
+
+
+def fetch_page(
+    params: dict,
+    page: int,
+    after_id: int | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> list[tuple]:
+    """
+    Fetch one page of display rows for the given filter parameters (on the shared connection unless given one).
+    Pass after_id (the last application_id of the previous page) to use keyset pagination instead of OFFSET.
+    """
+    if conn is None:
+        conn = get_conn()
+    show_archived = bool(params["show_archived"])
+    if after_id is not None:
+        cur = conn.execute(SQL_SELECT_AFTER[show_archived], {**params, "limit": PAGE_SIZE, "after_id": after_id})
+    else:
         cur = conn.execute(
-            """
-            SELECT application_id, company_name, role_title, date_applied, status, notes, archived
-            FROM Applications
-            WHERE application_id = ?;
-            """,
-            (app_id,),
+            SQL_SELECT_ALL[show_archived], {**params, "limit": PAGE_SIZE, "offset": page * PAGE_SIZE}
         )
-        row = cur.fetchone()
+    return cur.fetchall()
+
 
-    if not row:
-        return None
+def fetch_status_counts(show_archived: bool, conn: sqlite3.Connection | None = None) -> list[tuple[str, int]]:
+    """Return (status, count) pairs for the summary line, ordered by status."""
+    if conn is None:
+        conn = get_conn()
+    cur = conn.execute(SQL_STATUS_COUNTS[show_archived])
+    return cur.fetchall()
 
-    return {
-        "application_id": row[0],
-        "company_name": row[1],
-        "role_title": row[2],
-        "date_applied": row[3],
-        "status": row[4],
-        "notes": row[5] or "",
-        "archived": bool(row[6]),
-    }
+
+def bulk_insert(rows: Iterable[tuple], conn: sqlite3.Connection | None = None) -> int:
+    """
+    Insert many applications (e.g. from a CSV/JSON import) in a single transaction, one commit in total
+    (on the shared connection unless given one).
+    Each row is (company, role, date_applied, status, follow_up_date, notes), as bound by SQL_INSERT,
+    with both dates given as day numbers (see to_epoch_day).
+    Returns the number of rows inserted.
+    While the app is running, use IATApp.import_applications instead: it runs the import on the DB worker
+    and counts the new rows into the main table.
+    """
+    rows = iter(rows)
+    inserted = 0
+    if conn is None:
+        conn = get_conn()
+    with conn:
+        # Feed executemany in bounded chunks so a large import is never fully materialized at once.
+        while chunk := list(itertools.islice(rows, INSERT_CHUNK_SIZE)):
+            conn.executemany(SQL_INSERT, chunk)
+            inserted += len(chunk)
+    return inserted
+
+
+@functools.lru_cache(maxsize=256)
+def fetch_application_by_id(app_id: int) -> sqlite3.Row | None:
+    """
+    Fetch one application record as a (read-only) sqlite3.Row keyed by column name, or None if not found.
+    Results are cached; call fetch_application_by_id.cache_clear() after changing a row.
+    """
+    cur = get_conn().cursor()
+    cur.row_factory = sqlite3.Row
+    cur.execute(SQL_SELECT_ONE, (app_id,))
+    return cur.fetchone()
 
 
 class ApplicationFormWindow(tk.Toplevel):
@@ -86,46 +430,54 @@ class ApplicationFormWindow(tk.Toplevel):
     Reusable window for both Add and Edit.
     If app_id is None -> Add mode
     If app_id is int -> Edit mode (loads record and updates it)
+    If db_pool is given, the write runs on it instead of the Tk thread.
     """
 
-    def __init__(self, parent, on_saved_callback, app_id: int | None = None):
+    def __init__(
+        self,
+        parent,
+        on_saved_callback,
+        app_id: int | None = None,
+        db_pool: ThreadPoolExecutor | None = None,
+    ):
         super().__init__(parent)
         self.resizable(False, False)
         self.on_saved_callback = on_saved_callback
         self.app_id = app_id
+        self.db_pool = db_pool
 
         self.title("Edit Application" if self.app_id is not None else "Add Application")
 
-        self.company_var = tk.StringVar()
-        self.role_var = tk.StringVar()
-        self.date_var = tk.StringVar()
-        self.status_var = tk.StringVar(value="Applied")
-        self.notes_var = tk.StringVar()
-
         pad = {"padx": 10, "pady": 6}
 
+        # Widgets are read directly at save time; no StringVars/traces are needed.
         ttk.Label(self, text="Company Name (required)").grid(row=0, column=0, sticky="w", **pad)
-        ttk.Entry(self, textvariable=self.company_var, width=40).grid(row=0, column=1, **pad)
+        self.company_entry = ttk.Entry(self, width=40)
+        self.company_entry.grid(row=0, column=1, **pad)
 
         ttk.Label(self, text="Role Title (required)").grid(row=1, column=0, sticky="w", **pad)
-        ttk.Entry(self, textvariable=self.role_var, width=40).grid(row=1, column=1, **pad)
+        self.role_entry = ttk.Entry(self, width=40)
+        self.role_entry.grid(row=1, column=1, **pad)
 
         ttk.Label(self, text="Date Applied (YYYY-MM-DD) (required)").grid(row=2, column=0, sticky="w", **pad)
-        ttk.Entry(self, textvariable=self.date_var, width=40).grid(row=2, column=1, **pad)
+        self.date_entry = ttk.Entry(self, width=40)
+        self.date_entry.grid(row=2, column=1, **pad)
 
         ttk.Label(self, text="Status (required)").grid(row=3, column=0, sticky="w", **pad)
-        ttk.Combobox(self, textvariable=self.status_var, values=STATUSES, state="readonly", width=37).grid(
-            row=3, column=1, **pad
-        )
+        self.status_combo = ttk.Combobox(self, values=STATUSES, state="readonly", width=37)
+        self.status_combo.set("Applied")
+        self.status_combo.grid(row=3, column=1, **pad)
 
         ttk.Label(self, text="Notes (optional)").grid(row=4, column=0, sticky="w", **pad)
-        ttk.Entry(self, textvariable=self.notes_var, width=40).grid(row=4, column=1, **pad)
+        self.notes_entry = ttk.Entry(self, width=40)
+        self.notes_entry.grid(row=4, column=1, **pad)
 
         btn_frame = ttk.Frame(self)
         btn_frame.grid(row=5, column=0, columnspan=2, sticky="e", **pad)
 
         ttk.Button(btn_frame, text="Cancel", command=self.destroy).grid(row=0, column=0, padx=6)
-        ttk.Button(btn_frame, text="Save", command=self.save).grid(row=0, column=1, padx=6)
+        self.save_button = ttk.Button(btn_frame, text="Save", command=self.save)
+        self.save_button.grid(row=0, column=1, padx=6)
 
         if self.app_id is not None:
             self.load_existing()
@@ -139,18 +491,18 @@ class ApplicationFormWindow(tk.Toplevel):
             self.destroy()
             return
 
-        self.company_var.set(record["company_name"])
-        self.role_var.set(record["role_title"])
-        self.date_var.set(record["date_applied"])
-        self.status_var.set(record["status"])
-        self.notes_var.set(record["notes"])
+        self.company_entry.insert(0, record["company_name"])
+        self.role_entry.insert(0, record["role_title"])
+        self.date_entry.insert(0, record["date_applied"])
+        self.status_combo.set(record["status"])
+        self.notes_entry.insert(0, record["notes"])
 
     def save(self) -> None:
-        company = self.company_var.get().strip()
-        role = self.role_var.get().strip()
-        date_applied = self.date_var.get().strip()
-        status = self.status_var.get().strip()
-        notes = self.notes_var.get().strip()
+        company = self.company_entry.get().strip()
+        role = self.role_entry.get().strip()
+        date_applied = self.date_entry.get().strip()
+        status = self.status_combo.get()
+        notes = self.notes_entry.get().strip()
 
         if not company:
             messagebox.showerror("Validation Error", "Company name is required.")
@@ -161,8 +513,12 @@ class ApplicationFormWindow(tk.Toplevel):
         if not date_applied:
             messagebox.showerror("Validation Error", "Date applied is required.")
             return
+        if not _DATE_RE.fullmatch(date_applied):
+            messagebox.showerror("Validation Error", "Date must be in YYYY-MM-DD format (e.g., 2026-02-11).")
+            return
         try:
-            _ = parse_date_iso(date_applied)
+            # Right shape, but may still be an impossible date such as 2026-02-30.
+            applied = date.fromisoformat(date_applied)
         except ValueError:
             messagebox.showerror("Validation Error", "Date must be in YYYY-MM-DD format (e.g., 2026-02-11).")
             return
@@ -170,31 +526,57 @@ class ApplicationFormWindow(tk.Toplevel):
             messagebox.showerror("Validation Error", "Status must be one of the allowed categories.")
             return
 
-        follow_up_date = calculate_follow_up(date_applied)
-
-        with sqlite3.connect(DB_FILE) as conn:
-            if self.app_id is None:
-                conn.execute(
-                    """
-                    INSERT INTO Applications
-                    (company_name, role_title, date_applied, status, follow_up_date, notes, archived)
-                    VALUES (?, ?, ?, ?, ?, ?, 0);
-                    """,
-                    (company, role, date_applied, status, follow_up_date, notes),
-                )
-            else:
-                conn.execute(
-                    """
-                    UPDATE Applications
-                    SET company_name = ?, role_title = ?, date_applied = ?, status = ?, follow_up_date = ?, notes = ?
-                    WHERE application_id = ?;
-                    """,
-                    (company, role, date_applied, status, follow_up_date, notes, self.app_id),
-                )
-            conn.commit()
+        applied_day = to_epoch_day(applied)
+        follow_up_day = applied_day + FOLLOW_UP_DAYS
+
+        app_id = self.app_id
+        # On the worker, write through its own connection, never the one the Tk thread uses.
+        open_conn = get_conn if self.db_pool is None else get_worker_conn
+
+        def write() -> int:
+            # One transaction (and one commit) per Save; returns the saved application's id.
+            conn = open_conn()
+            with conn:
+                if app_id is None:
+                    cur = conn.execute(
+                        SQL_INSERT_RETURNING,
+                        (company, role, applied_day, status, follow_up_day, notes),
+                    )
+                else:
+                    cur = conn.execute(
+                        SQL_UPDATE,
+                        (company, role, applied_day, status, follow_up_day, notes, app_id),
+                    )
+                row = cur.fetchone()
+            if row is None:
+                # UPDATE matched nothing: the application was deleted while this form was open.
+                raise LookupError(f"Application {app_id} no longer exists.")
+            return row[0]
+
+        if self.db_pool is None:
+            write()
+            self.finish_save(None)
+            return
+
+        self.save_button.state(["disabled"])
+        future = self.db_pool.submit(write)
+        future.add_done_callback(functools.partial(self.master.post_to_tk, self.finish_save))
+
+    def finish_save(self, future: Future | None) -> None:
+        """Runs on the Tk thread once the write has finished."""
+        still_open = bool(self.winfo_exists())
+        if future is not None and future.exception() is not None:
+            if still_open:
+                self.save_button.state(["!disabled"])
+                messagebox.showerror("Error", f"Could not save the application: {future.exception()}")
+            return
+
+        if self.app_id is not None:
+            fetch_application_by_id.cache_clear()
 
         self.on_saved_callback()
-        self.destroy()
+        if still_open:
+            self.destroy()
 
 
 class FollowUpsDueWindow(tk.Toplevel):
@@ -208,78 +590,73 @@ class FollowUpsDueWindow(tk.Toplevel):
         header = ttk.Frame(self)
         header.pack(fill="x", padx=10, pady=10)
 
-        ttk.Label(header, text=f"Today: {today.isoformat()}").pack(side="left")
+        self.today_label = ttk.Label(header)
+        self.today_label.pack(side="left")
 
         ttk.Button(header, text="Close", command=self.destroy).pack(side="right")
 
         # Table
-        columns = ("id", "company", "role", "follow_up", "due_label", "status")
+        columns = tuple(key for key, _label, _width, _anchor in _DUE_COLS)
         self.tree = ttk.Treeview(self, columns=columns, show="headings", height=12)
 
-        self.tree.heading("id", text="ID")
-        self.tree.heading("company", text="Company")
-        self.tree.heading("role", text="Role")
-        self.tree.heading("follow_up", text="Follow-up Date")
-        self.tree.heading("due_label", text="Due")
-        self.tree.heading("status", text="Status")
-
-        self.tree.column("id", width=50, anchor="center")
-        self.tree.column("company", width=180)
-        self.tree.column("role", width=230)
-        self.tree.column("follow_up", width=120, anchor="center")
-        self.tree.column("due_label", width=120, anchor="center")
-        self.tree.column("status", width=140)
+        for key, label, width, anchor in _DUE_COLS:
+            self.tree.heading(key, text=label)
+            self.tree.column(key, width=width, anchor=anchor)
 
         self.tree.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        # Load due rows
-        self.load_due_rows(today)
-
         # Footer
         self.footer_var = tk.StringVar(value="")
         ttk.Label(self, textvariable=self.footer_var).pack(anchor="w", padx=10, pady=(0, 8))
 
+        # Load due rows once the window is up, so it paints before the query runs
+        self.after_idle(self.load_due_rows, today)
+
     def load_due_rows(self, today: date) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        with sqlite3.connect(DB_FILE) as conn:
-            cur = conn.execute(
-                """
-                SELECT application_id, company_name, role_title, follow_up_date, status
-                FROM Applications
-                WHERE archived = 0 AND follow_up_date <= ?
-                ORDER BY follow_up_date ASC, application_id ASC;
-                """,
-                (today.isoformat(),),
-            )
-            rows = cur.fetchall()
-
-        overdue_count = 0
-        today_count = 0
-
-        for app_id, company, role, follow_up_date, status in rows:
-            try:
-                fdate = parse_date_only(follow_up_date)
-            except ValueError:
-                # If somehow invalid, just label it generically
-                label = "Due"
-            else:
-                if fdate < today:
-                    label = "Overdue"
-                    overdue_count += 1
-                else:
-                    label = "Due Today"
-                    today_count += 1
+        self.today_label.configure(text=f"Today: {today.isoformat()}")
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+
+        # Dates are stored as day numbers, so the comparisons against today are plain integer compares.
+        params = {"today": to_epoch_day(today)}
+        conn = get_conn()
+
+        overdue_count, today_count = conn.execute(
+            """
+            SELECT COALESCE(SUM(follow_up_date < :today), 0), COALESCE(SUM(follow_up_date = :today), 0)
+            FROM Applications
+            WHERE archived = 0 AND follow_up_date <= :today;
+            """,
+            params,
+        ).fetchone()
+
+        cur = conn.execute(
+            f"""
+            SELECT application_id, company_name, role_title, {_DAY_SQL.format("follow_up_date")},
+                CASE WHEN follow_up_date < :today THEN 'Overdue' ELSE 'Due Today' END,
+                status
+            FROM Applications
+            WHERE archived = 0 AND follow_up_date <= :today
+            ORDER BY follow_up_date ASC, application_id ASC;
+            """,
+            params,
+        )
 
-            self.tree.insert(
-                "",
-                "end",
-                values=(app_id, company, role, follow_up_date, label, status),
-            )
+        # Rows arrive as tuples in column order with the Due label already filled in.
+        # Iterate the cursor directly so rows are inserted as SQLite produces them, never all held at once,
+        # and let the window repaint every FETCH_BATCH_SIZE rows.
+        tree_call, tree_path = self.tree.tk.call, str(self.tree)
+        count = 0
+        for row in cur:
+            # Raw Tcl call: skips ttk's per-call option parsing in this tight loop.
+            tree_call(tree_path, "insert", "", "end", "-values", row)
+            count += 1
+            if count % FETCH_BATCH_SIZE == 0:
+                self.update_idletasks()
 
         self.footer_var.set(
-            f"Total due: {len(rows)}  |  Overdue: {overdue_count}  |  Due today: {today_count}"
+            f"Total due: {overdue_count + today_count}  |  Overdue: {overdue_count}  |  Due today: {today_count}"
         )
 
 
@@ -289,6 +666,12 @@ class IATApp(tk.Tk):
         self.title("Internship Application Tracker")
         self.geometry("1120x560")
 
+        # Single worker so database work runs off the Tk thread but stays in order.
+        self._db_pool = ThreadPoolExecutor(max_workers=1)
+        # Set by on_close; from then on worker results are dropped and no new work is queued.
+        self._closing = False
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Top controls row
         top = ttk.Frame(self)
         top.pack(fill="x", padx=10, pady=10)
@@ -308,7 +691,11 @@ class IATApp(tk.Tk):
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(top, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=6)
-        search_entry.bind("<Return>", lambda _e: self.load_rows())
+        # Search as you type, but only once typing pauses (see _on_search_key).
+        self._search_after_id: str | None = None
+        # Search text of the last load_rows, so keys that do not change the text do not search again.
+        self._searched_text = ""
+        search_entry.bind("<KeyRelease>", self._on_search_key)
 
         ttk.Label(top, text="Status:").pack(side="left", padx=(10, 0))
         self.status_filter_var = tk.StringVar(value="All")
@@ -331,44 +718,107 @@ class IATApp(tk.Tk):
         ).pack(side="left", padx=(10, 0))
 
         ttk.Button(top, text="Clear Filters", command=self.clear_filters).pack(side="left", padx=10)
-        ttk.Button(top, text="Refresh", command=self.load_rows).pack(side="left", padx=6)
+        ttk.Button(top, text="Refresh", command=self.refresh_all).pack(side="left", padx=6)
 
         # Summary counts
         self.summary_var = tk.StringVar(value="")
         ttk.Label(self, textvariable=self.summary_var).pack(anchor="w", padx=10, pady=(0, 6))
 
         # Table (Treeview)
-        columns = ("id", "company", "role", "date_applied", "status", "follow_up", "archived")
+        columns = tuple(key for key, _label, _width, _anchor in _COLS)
         self.tree = ttk.Treeview(self, columns=columns, show="headings", height=18)
 
-        self.tree.heading("id", text="ID")
-        self.tree.heading("company", text="Company")
-        self.tree.heading("role", text="Role")
-        self.tree.heading("date_applied", text="Date Applied")
-        self.tree.heading("status", text="Status")
-        self.tree.heading("follow_up", text="Follow-up Date")
-        self.tree.heading("archived", text="Archived")
-
-        self.tree.column("id", width=50, anchor="center")
-        self.tree.column("company", width=200)
-        self.tree.column("role", width=280)
-        self.tree.column("date_applied", width=110, anchor="center")
-        self.tree.column("status", width=160)
-        self.tree.column("follow_up", width=120, anchor="center")
-        self.tree.column("archived", width=90, anchor="center")
+        for key, label, width, anchor in _COLS:
+            self.tree.heading(key, text=label)
+            self.tree.column(key, width=width, anchor=anchor)
 
         self.tree.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         self.tree.bind("<Double-1>", lambda _event: self.edit_selected())
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
+        for status, color in STATUS_TAG_COLORS.items():
+            self.tree.tag_configure(status, foreground=color)
+        self.tree.tag_configure("archived", foreground="gray")
+        # Pixel height of one row, for working out how many rows fit (see visible_rows).
+        self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        # (status, archived label) -> tags tuple, so rows share one tuple per combination
+        self._row_tags: dict[tuple[str, str], tuple[str, ...]] = {}
+
+        # One placeholder item per matching row (iid is str(position)); only cached pages hold values.
+        self._rows_params: dict = {}
+        # The latest load_rows job; results from older ones are dropped (see _apply_rows).
+        self._rows_future: Future | None = None
+        self._placeholder_count = 0
+        self._pages: OrderedDict[int, list] = OrderedDict()
+        # page -> last application_id on it, for keyset-fetching the page after it (reset on every refresh)
+        self._page_bounds: dict[int, int] = {}
+        # position -> values currently shown in the tree
+        self._row_index: dict[int, tuple] = {}
+
+        # Row counts for the unfiltered views. They are maintained in Python on add/archive/delete so the
+        # refreshes those trigger need no count query; the Refresh button re-counts (load_rows(recount=True))
+        # to pick up writes made anywhere else. _counts_version goes up on every Python-side change.
+        self._row_count, self._active_row_count = get_conn().execute(SQL_ROW_TOTALS).fetchone()
+        self._counts_version = 0
+        # _counts_version when the latest load_rows was submitted
+        self._rows_counts_version = 0
+
+        # Set while a coalesced refresh is waiting for the next idle cycle (see request_refresh).
+        self._refresh_pending = False
 
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
         ttk.Label(self, textvariable=self.status_var).pack(anchor="w", padx=10, pady=(0, 8))
 
-        self.load_rows()
+        # Show the window first; the initial query runs once the event loop is idle.
+        self.after_idle(self.load_rows)
+
+    def on_close(self) -> None:
+        """
+        Let queued database work finish, then close the connections and the window.
+        Never blocks the Tk thread: a worker job's done-callback may be waiting on it.
+        """
+        if self._closing:
+            return
+        self._closing = True
+        self.withdraw()
+        for child in self.winfo_children():
+            if isinstance(child, tk.Toplevel):
+                child.destroy()
+
+        # A queued refresh is no longer needed, but a queued Save still runs. The no-op job finishes last.
+        if self._rows_future is not None:
+            self._rows_future.cancel()
+        idle = self._db_pool.submit(lambda: None)
+        self._db_pool.shutdown(wait=False)
+        self._close_when_idle(idle)
+
+    def _close_when_idle(self, idle: Future) -> None:
+        if not idle.done():
+            self.after(50, self._close_when_idle, idle)
+            return
+        close_conn()
+        self.destroy()
+
+    def post_to_tk(self, callback, future: Future) -> None:
+        """
+        Done-callback for DB worker jobs (it runs on the worker): call callback(future) on the Tk thread.
+        Does nothing once on_close has started.
+        """
+        if self._closing:
+            return
+        self.after(0, lambda: None if self._closing else callback(future))
 
     def open_followups_due(self) -> None:
         FollowUpsDueWindow(self)
 
+    def refresh_all(self) -> None:
+        """Refresh button: re-count and reload the main table, and reload every open Follow-ups Due window."""
+        self.load_rows(recount=True)
+        today = date.today()
+        for child in self.winfo_children():
+            if isinstance(child, FollowUpsDueWindow):
+                child.load_due_rows(today)
+
     def clear_filters(self) -> None:
         self.search_var.set("")
         self.status_filter_var.set("All")
@@ -376,131 +826,286 @@ class IATApp(tk.Tk):
         self.load_rows()
 
     def open_add_window(self) -> None:
-        ApplicationFormWindow(self, on_saved_callback=self.load_rows, app_id=None)
+        ApplicationFormWindow(self, on_saved_callback=self.on_application_added, app_id=None, db_pool=self._db_pool)
 
-    def get_selected_app_id(self) -> int | None:
-        selected = self.tree.selection()
-        if not selected:
-            return None
-        values = self.tree.item(selected[0], "values")
-        if not values:
-            return None
-        try:
-            return int(values[0])
-        except (ValueError, TypeError):
-            return None
+    def on_application_added(self) -> None:
+        self.adjust_row_counts(1, 1)
+        self.request_refresh()
+
+    def import_applications(self, rows: Iterable[tuple]) -> None:
+        """Insert rows (as for bulk_insert) on the DB worker, then count them in and refresh the main table."""
+        future = self._db_pool.submit(lambda: bulk_insert(rows, get_worker_conn()))
+        future.add_done_callback(functools.partial(self.post_to_tk, self._finish_import))
+
+    def _finish_import(self, future: Future) -> None:
+        if future.exception() is not None:
+            messagebox.showerror("Import", f"Could not import the applications: {future.exception()}")
+            return
+        # bulk_insert adds active rows only.
+        inserted = future.result()
+        self.adjust_row_counts(inserted, inserted)
+        self.request_refresh()
+
+    def adjust_row_counts(self, total_delta: int, active_delta: int) -> None:
+        self._row_count += total_delta
+        self._active_row_count += active_delta
+        self._counts_version += 1
+
+    def _on_search_key(self, _event) -> None:
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        # <KeyRelease> also fires for Tab, arrows, Shift, Ctrl, ...; only search when the text changed.
+        if self.search_var.get().strip() == self._searched_text:
+            return
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        self._search_after_id = None
+        self.load_rows()
+
+    def request_refresh(self) -> None:
+        """Schedule load_rows for the next idle cycle; bursts of calls collapse into one refresh."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        self.load_rows()
 
     def edit_selected(self) -> None:
-        app_id = self.get_selected_app_id()
-        if app_id is None:
+        selected = self.get_selected_app_ids()
+        if not selected:
             messagebox.showinfo("Edit", "Please select an application to edit.")
             return
-        ApplicationFormWindow(self, on_saved_callback=self.load_rows, app_id=app_id)
+        ApplicationFormWindow(
+            self, on_saved_callback=self.request_refresh, app_id=selected[0], db_pool=self._db_pool
+        )
+
+    def get_selected_app_ids(self) -> list[int]:
+        """Return the application_id of every selected row, including rows whose page is not loaded."""
+        fetched_pages: dict[int, list[tuple]] = {}
+        selected = []
+        for iid in self.tree.selection():
+            position = int(iid)
+            values = self._row_index.get(position)
+            if values is None:
+                # Part of a range selection that scrolled out of the page cache; look it up without rendering.
+                page = position // PAGE_SIZE
+                if page not in fetched_pages:
+                    fetched_pages[page] = fetch_page(self._rows_params, page)
+                rows = fetched_pages[page]
+                if position % PAGE_SIZE >= len(rows):
+                    continue
+                values = rows[position % PAGE_SIZE]
+            selected.append(int(values[0]))
+        return selected
 
     def archive_selected(self) -> None:
-        app_id = self.get_selected_app_id()
-        if app_id is None:
+        selected = self.get_selected_app_ids()
+        if not selected:
             messagebox.showinfo("Archive", "Please select an application to archive.")
             return
 
-        if not messagebox.askyesno("Archive", "Archive the selected application?"):
+        if not messagebox.askyesno("Archive", f"Archive {len(selected)} selected application(s)?"):
             return
 
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.execute(
-                "UPDATE Applications SET archived = 1, status = 'Archived' WHERE application_id = ?;",
-                (app_id,),
-            )
-            conn.commit()
+        # One transaction for the whole selection, so it costs a single commit. Only rows that are still
+        # active match, so rowcount is exactly how many left the active count.
+        conn = get_conn()
+        with conn:
+            archived = conn.executemany(
+                "UPDATE Applications SET archived = 1, status = 'Archived' "
+                "WHERE application_id = ? AND archived = 0;",
+                [(app_id,) for app_id in selected],
+            ).rowcount
 
-        self.load_rows()
+        self.adjust_row_counts(0, -archived)
+        self.request_refresh()
 
     def delete_selected(self) -> None:
-        app_id = self.get_selected_app_id()
-        if app_id is None:
+        selected = self.get_selected_app_ids()
+        if not selected:
             messagebox.showinfo("Delete", "Please select an application to delete.")
             return
 
-        if not messagebox.askyesno("Delete", "This will permanently delete the selected application. Continue?"):
+        if not messagebox.askyesno(
+            "Delete", f"This will permanently delete {len(selected)} selected application(s). Continue?"
+        ):
             return
 
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.execute("DELETE FROM Applications WHERE application_id = ?;", (app_id,))
-            conn.commit()
-
-        self.load_rows()
-
-    def load_rows(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Active rows go first, so the two rowcounts say how many active and archived rows were really deleted.
+        ids = [(app_id,) for app_id in selected]
+        conn = get_conn()
+        with conn:
+            active_deleted = conn.executemany(
+                "DELETE FROM Applications WHERE application_id = ? AND archived = 0;", ids
+            ).rowcount
+            archived_deleted = conn.executemany("DELETE FROM Applications WHERE application_id = ?;", ids).rowcount
+
+        self.adjust_row_counts(-(active_deleted + archived_deleted), -active_deleted)
+        self.request_refresh()
+
+    def load_rows(self, recount: bool = False) -> None:
+        """Refresh the main table. recount=True re-reads the unfiltered row counts instead of trusting them."""
+        if self._closing:
+            return
+        fetch_application_by_id.cache_clear()
 
         search_text = self.search_var.get().strip()
+        self._searched_text = search_text
         status_filter = self.status_filter_var.get().strip()
         show_archived = self.show_archived_var.get()
 
-        where = []
-        params: list[str] = []
-
-        if not show_archived:
-            where.append("archived = 0")
-
-        if status_filter and status_filter != "All":
-            where.append("status = ?")
-            params.append(status_filter)
-
-        if search_text:
-            where.append("(company_name LIKE ? OR role_title LIKE ? OR notes LIKE ?)")
-            like = f"%{search_text}%"
-            params.extend([like, like, like])
-
-        where_sql = ""
-        if where:
-            where_sql = "WHERE " + " AND ".join(where)
-
-        query = f"""
-            SELECT application_id, company_name, role_title, date_applied, status, follow_up_date, archived
-            FROM Applications
-            {where_sql}
-            ORDER BY application_id DESC;
+        status = status_filter if status_filter and status_filter != "All" else None
+        params = {
+            "show_archived": int(show_archived),
+            "status": status,
+            "q": fts_prefix_query(search_text) if search_text else None,
+        }
+
+        # Carry the view over as rows, not yview() fractions: a list that fit on one screen reports (0.0, 1.0),
+        # which applied to a longer new list would prefetch all of it.
+        first_row, rows = self.visible_rows()
+
+        # Without status/search filters the row count is already known.
+        known_count = None
+        if status is None and not search_text and not recount:
+            known_count = self._row_count if show_archived else self._active_row_count
+        # With only a status filter, it can be read off the summary counts.
+        count_status = status if not search_text else None
+
+        # A refresh still waiting in the worker queue is superseded by this one.
+        if self._rows_future is not None:
+            self._rows_future.cancel()
+        future = self._rows_future = self._db_pool.submit(
+            self._query_rows, params, first_row, rows, known_count, count_status, recount
+        )
+        self._rows_counts_version = self._counts_version
+        future.add_done_callback(functools.partial(self.post_to_tk, self._apply_rows))
+
+    @staticmethod
+    def _query_rows(
+        params: dict,
+        first_row: int,
+        rows: int,
+        count: int | None,
+        count_status: str | None,
+        recount: bool,
+    ):
         """
+        Runs on the DB worker: everything a refresh needs in one job -- the status summary,
+        the matching row count (unless already known) and the pages in view -- on the worker's connection.
+        With recount, also the unfiltered row totals (None otherwise).
+        """
+        conn = get_worker_conn()
+        totals = conn.execute(SQL_ROW_TOTALS).fetchone() if recount else None
+        status_counts = fetch_status_counts(bool(params["show_archived"]), conn)
+        if count is None and count_status is not None:
+            count = dict(status_counts).get(count_status, 0)
+        if count is None:
+            count = conn.execute(SQL_COUNT_ALL[bool(params["show_archived"])], params).fetchone()[0]
+        pages = {page: fetch_page(params, page, conn=conn) for page in visible_page_range(count, first_row, rows)}
+        return params, count, pages, status_counts, totals
+
+    def _apply_rows(self, future: Future) -> None:
+        """Runs on the Tk thread with the result of _query_rows."""
+        if future.cancelled() or future is not self._rows_future:
+            # Cancelled or overtaken by a newer load_rows; that one's result is still to come.
+            return
+        params, count, pages, status_counts, totals = future.result()
+        # Unless an add/archive/delete already adjusted the counts since this job was queued.
+        if totals is not None and self._counts_version == self._rows_counts_version:
+            self._row_count, self._active_row_count = totals
+        self._rows_params = params
+        self._page_bounds.clear()
+
+        # Item iids are positions, and an Add, Archive or Delete shifts every later row, so remember the
+        # selection by application_id and reselect those rows once the new pages are in.
+        selected_ids = set()
+        for iid in self.tree.selection():
+            values = self._row_index.get(int(iid))
+            if values is not None:
+                selected_ids.add(values[0])
+
+        # Resize the placeholder list to the new row count.
+        if count > self._placeholder_count:
+            tree_call, tree_path = self.tree.tk.call, str(self.tree)
+            for position in range(self._placeholder_count, count):
+                tree_call(tree_path, "insert", "", "end", "-id", str(position))
+        elif count < self._placeholder_count:
+            self.tree.delete(*(str(position) for position in range(count, self._placeholder_count)))
+            for position in range(count, self._placeholder_count):
+                self._row_index.pop(position, None)
+        self._placeholder_count = count
+
+        # Show the prefetched pages, then blank anything left over from the previous query.
+        self._pages.clear()
+        for page, rows in pages.items():
+            self.show_page(page, rows)
+        self.render_visible_rows()
+        for position in [p for p in self._row_index if p // PAGE_SIZE not in self._pages]:
+            self.tree.item(str(position), values=(), tags=())
+            del self._row_index[position]
+        self.tree.selection_set([str(p) for p, values in self._row_index.items() if values[0] in selected_ids])
+
+        self.status_var.set(f"Loaded {count} application(s).")
+        self.show_summary_counts(status_counts)
+
+    def _on_tree_scroll(self, *_args) -> None:
+        self.render_visible_rows()
+
+    def visible_rows(self) -> tuple[int, int]:
+        """
+        Return (first visible row, rows the tree can show). The row count comes from the widget's size, so it
+        stays right while yview() still describes the list as it was before a refresh resized it.
+        """
+        if not self.tree.winfo_ismapped():
+            return 0, int(self.tree.cget("height"))
+        first, _last = self.tree.yview()
+        rows = max(int(self.tree.cget("height")), self.tree.winfo_height() // self._row_height)
+        return int(first * self._placeholder_count), rows
+
+    def render_visible_rows(self) -> None:
+        """Make sure every page overlapping the visible part of the tree is loaded."""
+        for page in visible_page_range(self._placeholder_count, *self.visible_rows()):
+            self.load_page(page)
+
+    def load_page(self, page: int) -> None:
+        """Fill one page of placeholder rows, keeping the last PAGE_CACHE_SIZE pages loaded."""
+        if page in self._pages:
+            self._pages.move_to_end(page)
+            return
 
-        with sqlite3.connect(DB_FILE) as conn:
-            cur = conn.execute(query, params)
-            rows = cur.fetchall()
-
-        for (app_id, company, role, date_applied, status, follow_up_date, archived) in rows:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    app_id,
-                    company,
-                    role,
-                    date_applied,
-                    status,
-                    follow_up_date,
-                    "Yes" if archived else "No",
-                ),
-            )
-
-        self.status_var.set(f"Loaded {len(rows)} application(s).")
-        self.update_summary_counts(show_archived=show_archived)
-
-    def update_summary_counts(self, show_archived: bool) -> None:
-        where_sql = "" if show_archived else "WHERE archived = 0"
-
-        with sqlite3.connect(DB_FILE) as conn:
-            cur = conn.execute(
-                f"""
-                SELECT status, COUNT(*)
-                FROM Applications
-                {where_sql}
-                GROUP BY status
-                ORDER BY status;
-                """
-            )
-            counts = cur.fetchall()
-
+        self.show_page(page, fetch_page(self._rows_params, page, self._page_bounds.get(page - 1)))
+
+    def show_page(self, page: int, rows: list[tuple]) -> None:
+        """Write one page of already-fetched rows into its placeholder items."""
+        self._pages[page] = rows
+        if rows:
+            self._page_bounds[page] = rows[-1][0]
+
+        # Only touch rows that changed since they were last shown; each tree call is a Tcl round-trip.
+        # Rows arrive already formatted for display (archived label comes from SQL).
+        for offset, values in enumerate(rows):
+            position = page * PAGE_SIZE + offset
+            if self._row_index.get(position) != values:
+                key = (values[4], values[6])
+                tags = self._row_tags.get(key)
+                if tags is None:
+                    tags = self._row_tags[key] = (values[4], "archived") if values[6] == "Yes" else (values[4],)
+                self.tree.item(str(position), values=values, tags=tags)
+                self._row_index[position] = values
+
+        while len(self._pages) > PAGE_CACHE_SIZE:
+            evicted, _ = self._pages.popitem(last=False)
+            for position in range(evicted * PAGE_SIZE, (evicted + 1) * PAGE_SIZE):
+                if self._row_index.pop(position, None) is not None:
+                    self.tree.item(str(position), values=(), tags=())
+
+    def show_summary_counts(self, counts: list[tuple[str, int]]) -> None:
         if not counts:
             self.summary_var.set("Summary: (no applications)")
             return